@@ -2,7 +2,6 @@ import base64
 import json
 from collections import OrderedDict
 
-from flag_engine.identities.builders import build_identity_model
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param
@@ -24,10 +23,10 @@ class EdgeIdentityPagination(CustomPagination):
                 json.dumps(last_evaluated_key).encode()
             )
 
-        return [
-            build_identity_model(identity_document)
-            for identity_document in dynamo_queryset["Items"]
-        ]
+        # EdgeIdentitySerializer only renders a few of the top level keys, so we
+        # return the identity documents as they are, rather than building the full
+        # engine identity model (with its traits and feature states) for each one
+        return dynamo_queryset["Items"]
 
     def get_next_link(self) -> str:
         url = self.request.build_absolute_uri()
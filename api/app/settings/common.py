@@ -375,10 +375,31 @@ LOGGING = {
 CACHE_FLAGS_SECONDS = env.int("CACHE_FLAGS_SECONDS", default=0)
 FLAGS_CACHE_LOCATION = "environment-flags"
 ENVIRONMENT_CACHE_LOCATION = "environment-objects"
+ENVIRONMENT_CACHE_SECONDS = env.int("ENVIRONMENT_CACHE_SECONDS", default=60)
 
 CACHE_PROJECT_SEGMENTS_SECONDS = env.int("CACHE_PROJECT_SEGMENTS_SECONDS", 0)
 PROJECT_SEGMENTS_CACHE_LOCATION = "project-segments"
 
+CACHE_IDENTITY_FLAGS_SECONDS = env.int("CACHE_IDENTITY_FLAGS_SECONDS", 0)
+IDENTITY_FLAGS_CACHE_LOCATION = "identity-flags"
+# the identity flags cache is invalidated when traits, flags or segments change but
+# the invalidation only reaches the processes that share the cache backend. With
+# the default local memory cache, other processes will serve stale flags until
+# CACHE_IDENTITY_FLAGS_SECONDS passes so use a shared backend (e.g. memcached or
+# redis) when running more than one process.
+IDENTITY_FLAGS_CACHE_BACKEND = env.str(
+    "IDENTITY_FLAGS_CACHE_BACKEND",
+    default="django.core.cache.backends.locmem.LocMemCache",
+)
+IDENTITY_FLAGS_CACHE_BACKEND_LOCATION = env.str(
+    "IDENTITY_FLAGS_CACHE_BACKEND_LOCATION", default=IDENTITY_FLAGS_CACHE_LOCATION
+)
+# there is an entry for every identity so the local memory cache needs to hold more
+# than the default of 300 entries to be useful
+IDENTITY_FLAGS_CACHE_MAX_ENTRIES = env.int(
+    "IDENTITY_FLAGS_CACHE_MAX_ENTRIES", default=10000
+)
+
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -396,7 +417,16 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": PROJECT_SEGMENTS_CACHE_LOCATION,
     },
+    IDENTITY_FLAGS_CACHE_LOCATION: {
+        "BACKEND": IDENTITY_FLAGS_CACHE_BACKEND,
+        "LOCATION": IDENTITY_FLAGS_CACHE_BACKEND_LOCATION,
+    },
 }
+if IDENTITY_FLAGS_CACHE_BACKEND == "django.core.cache.backends.locmem.LocMemCache":
+    # memcached clients don't accept MAX_ENTRIES as an option
+    CACHES[IDENTITY_FLAGS_CACHE_LOCATION]["OPTIONS"] = {
+        "MAX_ENTRIES": IDENTITY_FLAGS_CACHE_MAX_ENTRIES
+    }
 
 TRENCH_AUTH = {
     "FROM_EMAIL": DEFAULT_FROM_EMAIL,
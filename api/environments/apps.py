@@ -6,3 +6,7 @@ from django.apps import AppConfig
 
 class EnvironmentsConfig(AppConfig):
     name = "environments"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import environments.signals  # noqa
@@ -1,12 +1,8 @@
-from django.conf import settings
-from django.core.cache import caches
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
 from environments.models import Environment
 
-environment_cache = caches[settings.ENVIRONMENT_CACHE_LOCATION]
-
 
 class EnvironmentKeyAuthentication(BaseAuthentication):
     """
@@ -28,4 +24,8 @@ class EnvironmentKeyAuthentication(BaseAuthentication):
         return None, None
 
     def _can_serve_flags(self, environment):
+        # the organisation is cached along with the environment so this doesn't hit
+        # the database. Saving the organisation only evicts the environments from
+        # the cache of the process that saved it so, in other processes, a change to
+        # stop_serving_flags can take up to ENVIRONMENT_CACHE_SECONDS to apply.
         return not environment.project.organisation.stop_serving_flags
@@ -1,11 +1,20 @@
 import typing
+from functools import lru_cache
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 
 
+@lru_cache(maxsize=1024)
+def _get_environment_api_key_condition(environment_api_key: str):
+    # the condition for an environment never changes and boto3 doesn't mutate
+    # conditions when building queries, so we can reuse them across requests
+    return Key("environment_api_key").eq(environment_api_key)
+
+
 class DynamoIdentityWrapper:
     def __init__(self):
         self._table = None
@@ -20,6 +29,24 @@ class DynamoIdentityWrapper:
     def put_item(self, identity_dict: dict):
         self._table.put_item(Item=identity_dict)
 
+    def put_item_if_not_exists(self, identity_dict: dict) -> bool:
+        """
+        Write the identity only if there isn't one with the same composite key
+        already, in a single request to dynamodb.
+
+        :return: False if the identity already exists, else True
+        """
+        try:
+            self._table.put_item(
+                Item=identity_dict,
+                ConditionExpression=Attr("composite_key").not_exists(),
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
     def get_item(self, composite_key: str) -> typing.Optional[dict]:
         return self._table.get_item(Key={"composite_key": composite_key}).get("Item")
 
@@ -41,7 +68,7 @@ class DynamoIdentityWrapper:
     def get_all_items(
         self, environment_api_key: str, limit: int, start_key: dict = None
     ):
-        filter_expression = Key("environment_api_key").eq(environment_api_key)
+        filter_expression = _get_environment_api_key_condition(environment_api_key)
         query_kwargs = {
             "IndexName": "environment_api_key-identifier-index",
             "Limit": limit,
@@ -59,7 +86,7 @@ class DynamoIdentityWrapper:
         limit: int,
         start_key: dict = None,
     ):
-        filter_expression = Key("environment_api_key").eq(
+        filter_expression = _get_environment_api_key_condition(
             environment_api_key
         ) & search_function(identifier)
         query_kwargs = {
@@ -1,4 +1,5 @@
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
 
 from environments.dynamodb import DynamoIdentityWrapper
 
@@ -108,3 +109,37 @@ def test_search_items_with_identifier_calls_query_with_correct_arguments(mocker)
         & search_function(identifier),
         ExclusiveStartKey=start_key,
     )
+
+
+def test_put_item_if_not_exists_calls_put_item_with_condition(mocker):
+    # Given
+    dynamo_identity_wrapper = DynamoIdentityWrapper()
+    mocked_dynamo_table = mocker.patch.object(dynamo_identity_wrapper, "_table")
+    identity_dict = {"composite_key": "test_key"}
+
+    # When
+    result = dynamo_identity_wrapper.put_item_if_not_exists(identity_dict)
+
+    # Then
+    assert result is True
+    mocked_dynamo_table.put_item.assert_called_with(
+        Item=identity_dict,
+        ConditionExpression=Attr("composite_key").not_exists(),
+    )
+
+
+def test_put_item_if_not_exists_returns_false_if_item_exists(mocker):
+    # Given
+    dynamo_identity_wrapper = DynamoIdentityWrapper()
+    mocked_dynamo_table = mocker.patch.object(dynamo_identity_wrapper, "_table")
+    mocked_dynamo_table.put_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"
+    )
+
+    # When
+    result = dynamo_identity_wrapper.put_item_if_not_exists(
+        {"composite_key": "test_key"}
+    )
+
+    # Then
+    assert result is False
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class IdentitiesConfig(AppConfig):
     name = "environments.identities"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import environments.identities.signals  # noqa
@@ -1,11 +1,18 @@
 import hashlib
 import typing
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
 
 from integrations.amplitude.amplitude import AmplitudeWrapper
 from integrations.heap.heap import HeapWrapper
 from integrations.mixpanel.mixpanel import MixpanelWrapper
 from integrations.segment.segment import SegmentWrapper
 
+if typing.TYPE_CHECKING:
+    from environments.identities.traits.models import Trait
+
 IDENTITY_INTEGRATIONS = [
     {"relation_name": "amplitude_config", "wrapper": AmplitudeWrapper},
     {"relation_name": "segment_config", "wrapper": SegmentWrapper},
@@ -13,6 +20,8 @@ IDENTITY_INTEGRATIONS = [
     {"relation_name": "mixpanel_config", "wrapper": MixpanelWrapper},
 ]
 
+identity_flags_cache = caches[settings.IDENTITY_FLAGS_CACHE_LOCATION]
+
 
 def identify_integrations(identity, all_feature_states):
     for integration in IDENTITY_INTEGRATIONS:
@@ -27,6 +36,49 @@ def identify_integrations(identity, all_feature_states):
             wrapper_instance.identify_user_async(data=user_data)
 
 
+def has_identity_integrations(environment) -> bool:
+    return any(
+        getattr(
+            getattr(environment, integration["relation_name"], None), "api_key", None
+        )
+        for integration in IDENTITY_INTEGRATIONS
+    )
+
+
+def get_identity_flags_cache_key(environment_api_key: str, identifier: str) -> str:
+    # the key includes a version for the environment which is reset whenever its
+    # flags or segments change, invalidating the cached flags for all of its
+    # identities at once. Identifiers can be long and contain characters that
+    # aren't valid in some cache backends (e.g. memcached) so we hash the key.
+    version_key = _get_identity_flags_cache_version_key(environment_api_key)
+    version = identity_flags_cache.get(version_key)
+    if version is None:
+        # either the first request for the environment or the version was reset
+        # (or evicted by the cache backend), both of which start a new version
+        version = uuid.uuid4().hex
+        identity_flags_cache.set(version_key, version, timeout=None)
+
+    return hashlib.sha1(
+        f"{environment_api_key}:{version}:{identifier}".encode("utf-8")
+    ).hexdigest()
+
+
+def clear_identity_flags_cache(environment_api_key: str, identifier: str):
+    identity_flags_cache.delete(
+        get_identity_flags_cache_key(environment_api_key, identifier)
+    )
+
+
+def clear_environment_identity_flags_cache(environment_api_key: str):
+    identity_flags_cache.delete(
+        _get_identity_flags_cache_version_key(environment_api_key)
+    )
+
+
+def _get_identity_flags_cache_version_key(environment_api_key: str) -> str:
+    return f"version:{environment_api_key}"
+
+
 def get_hashed_percentage_for_object_ids(
     object_ids: typing.Iterable[int], iterations: int = 1
 ) -> float:
@@ -54,3 +106,15 @@ def get_hashed_percentage_for_object_ids(
         )
 
     return value
+
+
+def get_traits_by_key(traits: typing.Iterable["Trait"]) -> typing.Dict[str, "Trait"]:
+    """
+    Index the given traits by trait key so that each condition can look up the
+    trait it applies to without scanning the full list of traits.
+    """
+    traits_by_key = {}
+    for trait in traits:
+        # keep the first trait for a given key to match the previous behaviour
+        traits_by_key.setdefault(trait.trait_key, trait)
+    return traits_by_key
@@ -5,11 +5,15 @@ from django.db.models import Prefetch, Q
 from django.utils.encoding import python_2_unicode_compatible
 
 from environments.dynamodb import DynamoIdentityWrapper
+from environments.identities.helpers import get_traits_by_key
 from environments.identities.traits.models import Trait
 from environments.models import Environment
 from features.models import FeatureState
 from features.multivariate.models import MultivariateFeatureStateValue
 
+if typing.TYPE_CHECKING:
+    from segments.models import Segment
+
 
 @python_2_unicode_compatible
 class Identity(models.Model):
@@ -29,7 +33,12 @@ class Identity(models.Model):
         # issues with production deployment due to multi server configuration.
         db_table = "environments_identity"
 
-    def get_all_feature_states(self, traits: typing.List[Trait] = None):
+    def get_all_feature_states(
+        self,
+        traits: typing.List[Trait] = None,
+        segments: typing.List["Segment"] = None,
+        feature_name: str = None,
+    ):
         """
         Get all feature states for an identity. This method returns a single flag for
         each feature in the identity's environment's project. The flag returned is the
@@ -39,10 +48,16 @@ class Identity(models.Model):
             2. Segment - flag overridden for a segment this identity belongs to
             3. Environment - default value for the environment
 
+        :param traits: optional list of traits to use instead of the identity's
+            persisted traits
+        :param segments: optional list of segments that the identity belongs to, if
+            they have already been evaluated
+        :param feature_name: optional name of a feature to limit the flags to
         :return: (list) flags for an identity with the correct values based on
             identity / segment priorities
         """
-        segments = self.get_segments(traits=traits)
+        if segments is None:
+            segments = self.get_segments(traits=traits)
 
         # define sub queries
         belongs_to_environment_query = Q(environment=self.environment)
@@ -59,6 +74,8 @@ class Identity(models.Model):
             | overridden_for_segment_query
             | environment_default_query
         )
+        if feature_name is not None:
+            full_query &= Q(feature__name=feature_name)
 
         select_related_args = [
             "feature",
@@ -98,12 +115,25 @@ class Identity(models.Model):
 
         return list(identity_flags.values())
 
+    def get_feature_state(self, feature_name: str) -> typing.Optional[FeatureState]:
+        """
+        Get the flag for a single feature for the identity, using the same priorities
+        as get_all_feature_states.
+
+        :param feature_name: name of the feature to get the flag for
+        :return: the flag for the given feature or None if it doesn't exist
+        """
+        feature_states = self.get_all_feature_states(feature_name=feature_name)
+        return feature_states[0] if feature_states else None
+
     def get_segments(self, traits: typing.List[Trait] = None):
         segments = []
         traits = self.identity_traits.all() if traits is None else traits
+        # index the traits once rather than scanning them for every condition
+        traits_by_key = get_traits_by_key(traits)
 
         for segment in self.environment.project.get_segments_from_cache():
-            if segment.does_identity_match(self, traits=traits):
+            if segment.does_identity_match(self, traits=traits_by_key):
                 segments.append(segment)
 
         return segments
@@ -42,11 +42,12 @@ class EdgeIdentitySerializer(serializers.ModelSerializer):
         self.instance = EngineIdentity(
             identifier=identifier, environment_api_key=environment_api_key
         )
-        if Identity.dynamo_wrapper.get_item(self.instance.composite_key):
+        if not Identity.dynamo_wrapper.put_item_if_not_exists(
+            build_identity_dict(self.instance)
+        ):
             raise ValidationError(
                 f"Identity with identifier: {identifier} already exists"
             )
-        Identity.dynamo_wrapper.put_item(build_identity_dict(self.instance))
         return self.instance
 
 
@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from environments.identities.helpers import (
+    clear_environment_identity_flags_cache,
+    clear_identity_flags_cache,
+)
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment
+from features.models import (
+    Feature,
+    FeatureSegment,
+    FeatureState,
+    FeatureStateValue,
+)
+from features.multivariate.models import (
+    MultivariateFeatureOption,
+    MultivariateFeatureStateValue,
+)
+from projects.models import Project
+from segments.models import Segment
+
+
+def _identity_flags_cache_enabled():
+    return settings.CACHE_IDENTITY_FLAGS_SECONDS > 0
+
+
+@receiver(post_save, sender=Identity)
+@receiver(post_delete, sender=Identity)
+def clear_identity_flags_cache_for_identity(sender, instance, *args, **kwargs):
+    if _identity_flags_cache_enabled():
+        clear_identity_flags_cache(instance.environment.api_key, instance.identifier)
+
+
+@receiver(post_save, sender=Trait)
+@receiver(post_delete, sender=Trait)
+def clear_identity_flags_cache_for_trait(sender, instance, *args, **kwargs):
+    if _identity_flags_cache_enabled():
+        identity = instance.identity
+        clear_identity_flags_cache(identity.environment.api_key, identity.identifier)
+
+
+@receiver(post_save, sender=FeatureState)
+@receiver(post_delete, sender=FeatureState)
+@receiver(post_save, sender=FeatureSegment)
+@receiver(post_delete, sender=FeatureSegment)
+def clear_identity_flags_cache_for_environment(sender, instance, *args, **kwargs):
+    if _identity_flags_cache_enabled() and instance.environment_id:
+        clear_environment_identity_flags_cache(instance.environment.api_key)
+
+
+@receiver(post_save, sender=FeatureStateValue)
+@receiver(post_save, sender=MultivariateFeatureStateValue)
+@receiver(post_delete, sender=MultivariateFeatureStateValue)
+def clear_identity_flags_cache_for_feature_state(sender, instance, *args, **kwargs):
+    # feature state values are updated separately from their feature states
+    if _identity_flags_cache_enabled() and instance.feature_state.environment_id:
+        clear_environment_identity_flags_cache(
+            instance.feature_state.environment.api_key
+        )
+
+
+@receiver(post_save, sender=Segment)
+@receiver(post_delete, sender=Segment)
+@receiver(post_save, sender=Feature)
+@receiver(post_delete, sender=Feature)
+def clear_identity_flags_cache_for_project_object(sender, instance, *args, **kwargs):
+    # segments and features are shared by all of the environments in a project
+    if _identity_flags_cache_enabled():
+        _clear_project_identity_flags_cache(instance.project_id)
+
+
+@receiver(post_save, sender=MultivariateFeatureOption)
+@receiver(post_delete, sender=MultivariateFeatureOption)
+def clear_identity_flags_cache_for_multivariate_option(
+    sender, instance, *args, **kwargs
+):
+    if _identity_flags_cache_enabled():
+        _clear_project_identity_flags_cache(instance.feature.project_id)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def clear_identity_flags_cache_for_project(sender, instance, *args, **kwargs):
+    # e.g. hide_disabled_flags changes which flags are returned
+    if _identity_flags_cache_enabled():
+        _clear_project_identity_flags_cache(instance.id)
+
+
+def _clear_project_identity_flags_cache(project_id: int):
+    api_keys = Environment.objects.filter(project_id=project_id).values_list(
+        "api_key", flat=True
+    )
+    for api_key in api_keys:
+        clear_environment_identity_flags_cache(api_key)
@@ -6,6 +6,7 @@ import pytest
 
 from environments.identities.helpers import (
     get_hashed_percentage_for_object_ids,
+    get_traits_by_key,
     identify_integrations,
 )
 from environments.identities.models import Identity
@@ -197,3 +198,16 @@ def test_get_hashed_percentage_does_not_return_1(mock_hashlib):
     # the second call, with a string (in bytes) that contains each object id twice
     expected_bytes_2 = ",".join(str(id_) for id_ in object_ids * 2).encode("utf-8")
     assert call_list[1][0][0] == expected_bytes_2
+
+
+def test_get_traits_by_key_keeps_first_trait_for_each_key():
+    # Given
+    first_trait = mock.MagicMock(trait_key="key")
+    duplicate_trait = mock.MagicMock(trait_key="key")
+    other_trait = mock.MagicMock(trait_key="other_key")
+
+    # When
+    traits_by_key = get_traits_by_key([first_trait, duplicate_trait, other_trait])
+
+    # Then
+    assert traits_by_key == {"key": first_trait, "other_key": other_trait}
@@ -1,4 +1,4 @@
-from django.test import TransactionTestCase
+from django.test import TestCase
 
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
@@ -30,7 +30,7 @@ from .helpers import (
 )
 
 
-class IdentityTestCase(TransactionTestCase):
+class IdentityTestCase(TestCase):
     def setUp(self):
         self.organisation = Organisation.objects.create(name="Test Org")
         self.project = Project.objects.create(
@@ -647,6 +647,66 @@ class IdentityTestCase(TransactionTestCase):
         assert len(feature_states) == 1
         assert feature_states[0].enabled == enabled_for_segment
 
+    def test_get_all_feature_states_uses_segments_if_passed(self):
+        # Given
+        identity = Identity.objects.create(
+            identifier="test-identity", environment=self.environment
+        )
+
+        # a segment that the identity doesn't match based on its traits
+        segment = Segment.objects.create(name="Test segment", project=self.project)
+        rule = SegmentRule.objects.create(segment=segment, type=SegmentRule.ALL_RULE)
+        Condition.objects.create(
+            rule=rule, property="trait-key", value="trait-value", operator=EQUAL
+        )
+
+        feature = Feature.objects.create(name="test-feature", project=self.project)
+        feature_segment = FeatureSegment.objects.create(
+            feature=feature, segment=segment, environment=self.environment
+        )
+        FeatureState.objects.create(
+            feature=feature,
+            feature_segment=feature_segment,
+            environment=self.environment,
+            enabled=True,
+        )
+
+        # When
+        feature_states = identity.get_all_feature_states(segments=[segment])
+
+        # Then
+        assert len(feature_states) == 1
+        assert feature_states[0].feature_segment == feature_segment
+
+    def test_get_feature_state_returns_identity_override_for_feature(self):
+        # Given
+        identity = Identity.objects.create(
+            identifier="test-identity", environment=self.environment
+        )
+        feature = Feature.objects.create(name="test-feature", project=self.project)
+        Feature.objects.create(name="another-feature", project=self.project)
+        identity_override = FeatureState.objects.create(
+            feature=feature, identity=identity, environment=self.environment
+        )
+
+        # When
+        feature_state = identity.get_feature_state(feature.name)
+
+        # Then
+        assert feature_state == identity_override
+
+    def test_get_feature_state_returns_none_if_feature_does_not_exist(self):
+        # Given
+        identity = Identity.objects.create(
+            identifier="test-identity", environment=self.environment
+        )
+
+        # When
+        feature_state = identity.get_feature_state("unknown-feature")
+
+        # Then
+        assert feature_state is None
+
     def test_generate_traits_with_persistence(self):
         # Given
         identity = Identity.objects.create(
@@ -4,6 +4,7 @@ from unittest import mock
 from unittest.case import TestCase
 
 import pytest
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -318,6 +319,190 @@ class SDKIdentitiesTestCase(APITestCase):
         # and
         assert len(response.json().get("flags")) == 2
 
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_identities_endpoint_returns_cached_response_if_flags_cache_enabled(
+        self,
+    ):
+        # Given
+        base_url = reverse("api-v1:sdk-identities")
+        url = base_url + "?identifier=" + self.identity.identifier
+        first_response = self.client.get(url)
+
+        # When
+        with self.assertNumQueries(0):
+            second_response = self.client.get(url)
+
+        # Then
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.json() == first_response.json()
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    @mock.patch("integrations.amplitude.amplitude.AmplitudeWrapper.identify_user_async")
+    def test_identities_endpoint_calls_integrations_for_cached_response(
+        self, mock_amplitude_wrapper
+    ):
+        # Given
+        AmplitudeConfiguration.objects.create(
+            api_key="abc-123", environment=self.environment
+        )
+        base_url = reverse("api-v1:sdk-identities")
+        url = base_url + "?identifier=" + self.identity.identifier
+        first_response = self.client.get(url)
+
+        # When
+        second_response = self.client.get(url)
+
+        # Then
+        assert second_response.json() == first_response.json()
+
+        # and amplitude identify users should be called for both requests
+        assert mock_amplitude_wrapper.call_count == 2
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_post_identify_clears_cached_response_for_identity(self):
+        # Given
+        get_url = (
+            reverse("api-v1:sdk-identities") + "?identifier=" + self.identity.identifier
+        )
+        self.client.get(get_url)
+
+        data = {
+            "identifier": self.identity.identifier,
+            "traits": [{"trait_key": "my_trait", "trait_value": 123}],
+        }
+
+        # When
+        self.client.post(
+            reverse("api-v1:sdk-identities"),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+        response = self.client.get(get_url)
+
+        # Then
+        assert response.json()["traits"][0]["trait_key"] == "my_trait"
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_setting_trait_clears_cached_response_for_identity(self):
+        # Given
+        get_url = (
+            reverse("api-v1:sdk-identities") + "?identifier=" + self.identity.identifier
+        )
+        self.client.get(get_url)
+
+        data = {
+            "identity": {"identifier": self.identity.identifier},
+            "trait_key": "my_trait",
+            "trait_value": "my_value",
+        }
+
+        # When
+        self.client.post(
+            reverse("api-v1:sdk-traits-list"),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+        response = self.client.get(get_url)
+
+        # Then
+        assert response.json()["traits"][0]["trait_key"] == "my_trait"
+        assert response.json()["traits"][0]["trait_value"] == "my_value"
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_updating_feature_state_clears_cached_responses_for_environment(self):
+        # Given
+        get_url = (
+            reverse("api-v1:sdk-identities") + "?identifier=" + self.identity.identifier
+        )
+        self.client.get(get_url)
+
+        feature_state = FeatureState.objects.get(
+            environment=self.environment, feature=self.feature_1
+        )
+        feature_state.enabled = True
+
+        # When
+        feature_state.save()
+        response = self.client.get(get_url)
+
+        # Then
+        flag = next(
+            flag
+            for flag in response.json()["flags"]
+            if flag["feature"]["id"] == self.feature_1.id
+        )
+        assert flag["enabled"] is True
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_updating_feature_clears_cached_responses_for_environment(self):
+        # Given
+        get_url = (
+            reverse("api-v1:sdk-identities") + "?identifier=" + self.identity.identifier
+        )
+        self.client.get(get_url)
+
+        new_name = "Updated Feature 1"
+        self.feature_1.name = new_name
+
+        # When
+        self.feature_1.save()
+        response = self.client.get(get_url)
+
+        # Then
+        assert new_name in [
+            flag["feature"]["name"] for flag in response.json()["flags"]
+        ]
+
+    @override_settings(CACHE_IDENTITY_FLAGS_SECONDS=60)
+    def test_updating_project_clears_cached_responses_for_environment(self):
+        # Given
+        get_url = (
+            reverse("api-v1:sdk-identities") + "?identifier=" + self.identity.identifier
+        )
+        self.client.get(get_url)
+
+        self.project.hide_disabled_flags = True
+
+        # When
+        self.project.save()
+        response = self.client.get(get_url)
+
+        # Then
+        assert response.json()["flags"] == []
+
+    def test_identities_endpoint_returns_304_if_response_not_modified(self):
+        # Given
+        base_url = reverse("api-v1:sdk-identities")
+        url = base_url + "?identifier=" + self.identity.identifier
+        first_response = self.client.get(url)
+
+        # When
+        second_response = self.client.get(
+            url, HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        # Then
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_identities_endpoint_returns_200_if_response_modified(self):
+        # Given
+        base_url = reverse("api-v1:sdk-identities")
+        url = base_url + "?identifier=" + self.identity.identifier
+        first_response = self.client.get(url)
+
+        Trait.objects.create(
+            identity=self.identity, trait_key="my_trait", string_value="value"
+        )
+
+        # When
+        second_response = self.client.get(
+            url, HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        # Then
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.json()["traits"][0]["trait_key"] == "my_trait"
+
     @mock.patch("integrations.amplitude.amplitude.AmplitudeWrapper.identify_user_async")
     def test_identities_endpoint_get_all_feature_amplitude_called(
         self, mock_amplitude_wrapper
@@ -28,6 +28,20 @@ class TraitSerializerBasic(serializers.ModelSerializer):
         fields = ("id", "trait_key", "trait_value")
         read_only_fields = ("id",)
 
+    def to_representation(self, instance):
+        # this is used to render every trait in the SDK responses so we build the
+        # representation directly rather than going through each field in turn
+        trait_value = instance.trait_value
+        return {
+            "id": instance.id,
+            "trait_key": instance.trait_key,
+            "trait_value": (
+                None
+                if trait_value is None
+                else self.fields["trait_value"].to_representation(trait_value)
+            ),
+        }
+
 
 class IncrementTraitValueSerializer(serializers.Serializer):
     trait_key = serializers.CharField()
@@ -68,10 +68,7 @@ class TraitViewSet(viewsets.ModelViewSet):
         """
         data = request.data
         environment = self.get_environment_from_request()
-        if (
-            environment.project.organisation
-            not in self.request.user.organisations.all()
-        ):
+        if not self.request.user.belongs_to(environment.project.organisation_id):
             return Response(status=status.HTTP_403_FORBIDDEN)
 
         identity_pk = self.kwargs.get("identity_pk")
@@ -5,13 +5,20 @@ from collections import namedtuple
 
 import coreapi
 from boto3.dynamodb.conditions import Key
+from django.conf import settings
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.schemas import AutoSchema
 
 from app.pagination import CustomPagination, EdgeIdentityPagination
-from environments.identities.helpers import identify_integrations
+from environments.identities.helpers import (
+    clear_identity_flags_cache,
+    get_identity_flags_cache_key,
+    has_identity_integrations,
+    identify_integrations,
+    identity_flags_cache,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     EdgeIdentitySerializer,
@@ -88,8 +95,18 @@ class EdgeIdentityViewSet(viewsets.ModelViewSet):
     def get_environment_from_request(self):
         """
         Get environment object from URL parameters in request.
+
+        The environment is stored on the view so that it is only retrieved once
+        per request.
         """
-        return Environment.objects.get(api_key=self.kwargs["environment_api_key"])
+        if not hasattr(self, "_environment"):
+            # only the project's dynamo setting is needed to validate the request
+            self._environment = (
+                Environment.objects.select_related("project")
+                .only("id", "api_key", "project__id", "project__enable_dynamo_db")
+                .get(api_key=self.kwargs["environment_api_key"])
+            )
+        return self._environment
 
     def perform_destroy(self, instance):
         Identity.dynamo_wrapper.delete_item(instance["composite_key"])
@@ -124,8 +141,15 @@ class IdentityViewSet(viewsets.ModelViewSet):
     def get_environment_from_request(self):
         """
         Get environment object from URL parameters in request.
+
+        The environment is stored on the view so that it is only retrieved once
+        per request.
         """
-        return Environment.objects.get(api_key=self.kwargs["environment_api_key"])
+        if not hasattr(self, "_environment"):
+            self._environment = Environment.objects.get(
+                api_key=self.kwargs["environment_api_key"]
+            )
+        return self._environment
 
     def perform_create(self, serializer):
         environment = self.get_environment_from_request()
@@ -177,7 +201,7 @@ class SDKIdentitiesDeprecated(SDKAPIView):
             )
 
         if identity:
-            traits_data = identity.get_all_user_traits()
+            traits_data = list(identity.get_all_user_traits())
             # traits_data = self.get_serializer(identity.get_all_user_traits(), many=True)
             # return Response(traits.data, status=status.HTTP_200_OK)
         else:
@@ -190,10 +214,14 @@ class SDKIdentitiesDeprecated(SDKAPIView):
         IdentityFlagsWithTraitsAndSegments = namedtuple(
             "IdentityTraitFlagsSegments", ("flags", "traits", "segments")
         )
+        # evaluate the traits and segments once and reuse them to get the flags
+        segments = identity.get_segments(traits=traits_data)
         identity_flags_traits_segments = IdentityFlagsWithTraitsAndSegments(
-            flags=identity.get_all_feature_states(),
+            flags=identity.get_all_feature_states(
+                traits=traits_data, segments=segments
+            ),
             traits=traits_data,
-            segments=identity.get_segments(),
+            segments=segments,
         )
 
         serializer = IdentitySerializerWithTraitsAndSegments(
@@ -214,17 +242,16 @@ class SDKIdentities(SDKAPIView):
                 {"detail": "Missing identifier"}
             )  # TODO: add 400 status - will this break the clients?
 
-        identity, _ = (
-            Identity.objects.select_related("environment", "environment__project")
-            .prefetch_related("identity_traits", "environment__project__segments")
-            .get_or_create(identifier=identifier, environment=request.environment)
-        )
-
         feature_name = request.query_params.get("feature")
         if feature_name:
+            identity = self._get_identity(identifier)
             return self._get_single_feature_state_response(identity, feature_name)
-        else:
-            return self._get_all_feature_states_for_user_response(identity)
+
+        if settings.CACHE_IDENTITY_FLAGS_SECONDS > 0:
+            return self._get_all_feature_states_for_user_response_from_cache(identifier)
+
+        identity = self._get_identity(identifier)
+        return self._get_all_feature_states_for_user_response(identity)
 
     def get_serializer_context(self):
         context = super(SDKIdentities, self).get_serializer_context()
@@ -239,25 +266,53 @@ class SDKIdentities(SDKAPIView):
         serializer.is_valid(raise_exception=True)
         instance = serializer.save()
 
-        # we need to serialize the response again to ensure that the
-        # trait values are serialized correctly
-        response_serializer = IdentifyWithTraitsSerializer(
-            instance=instance,
-            context={"identity": instance.get("identity")},  # todo: improve this
+        if settings.CACHE_IDENTITY_FLAGS_SECONDS > 0:
+            # the traits for the identity may have changed so make sure that we
+            # don't serve stale flags for it from the cache
+            clear_identity_flags_cache(
+                request.environment.api_key, instance["identity"].identifier
+            )
+
+        return Response(serializer.data)
+
+    def _get_identity(self, identifier):
+        identity, _ = (
+            Identity.objects.select_related("environment", "environment__project")
+            .prefetch_related("identity_traits", "environment__project__segments")
+            .get_or_create(identifier=identifier, environment=self.request.environment)
         )
-        return Response(response_serializer.data)
+        return identity
+
+    def _get_all_feature_states_for_user_response_from_cache(self, identifier):
+        cache_key = get_identity_flags_cache_key(
+            self.request.environment.api_key, identifier
+        )
+        data = identity_flags_cache.get(cache_key)
+        if not data:
+            identity = self._get_identity(identifier)
+            data = self._get_all_feature_states_for_user_response(identity).data
+            identity_flags_cache.set(
+                cache_key, data, settings.CACHE_IDENTITY_FLAGS_SECONDS
+            )
+        elif has_identity_integrations(self.request.environment):
+            # only the serialized response is cached so the identity and its flags
+            # still need to be sent to any integrations on a cache hit
+            identity = self._get_identity(identifier)
+            identify_integrations(identity, identity.get_all_feature_states())
+
+        return Response(data=data, status=status.HTTP_200_OK)
 
     def _get_single_feature_state_response(self, identity, feature_name):
-        for feature_state in identity.get_all_feature_states():
-            if feature_state.feature.name == feature_name:
-                serializer = FeatureStateSerializerFull(
-                    feature_state, context={"identity": identity}
-                )
-                return Response(data=serializer.data, status=status.HTTP_200_OK)
+        feature_state = identity.get_feature_state(feature_name)
+        if not feature_state:
+            return Response(
+                {"detail": "Given feature not found"}, status=status.HTTP_404_NOT_FOUND
+            )
 
-        return Response(
-            {"detail": "Given feature not found"}, status=status.HTTP_404_NOT_FOUND
+        serializer = FeatureStateSerializerFull(
+            feature_state, context={"identity": identity}
         )
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
 
     def _get_all_feature_states_for_user_response(self, identity, trait_models=None):
         """
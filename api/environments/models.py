@@ -10,10 +10,15 @@ from django.core.cache import caches
 from django.db import models
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.translation import ugettext_lazy as _
-from django_lifecycle import AFTER_CREATE, LifecycleModel, hook
+from django_lifecycle import (
+    AFTER_CREATE,
+    AFTER_DELETE,
+    AFTER_UPDATE,
+    LifecycleModel,
+    hook,
+)
 
 from app.utils import create_hash
-from environments.exceptions import EnvironmentHeaderNotPresentError
 from features.models import FeatureState
 from projects.models import Project
 from webhooks.models import AbstractBaseWebhookModel
@@ -62,6 +67,11 @@ class Environment(LifecycleModel):
                 enabled=feature.default_enabled,
             )
 
+    @hook(AFTER_UPDATE)
+    @hook(AFTER_DELETE)
+    def clear_environment_cache(self):
+        environment_cache.delete(self.api_key)
+
     def __str__(self):
         return "Project %s - Environment %s" % (self.project.name, self.name)
 
@@ -87,17 +97,6 @@ class Environment(LifecycleModel):
 
         return clone
 
-    @staticmethod
-    def get_environment_from_request(request):
-        try:
-            environment_key = request.META["HTTP_X_ENVIRONMENT_KEY"]
-        except KeyError:
-            raise EnvironmentHeaderNotPresentError
-
-        return Environment.objects.select_related(
-            "project", "project__organisation"
-        ).get(api_key=environment_key)
-
     @classmethod
     def get_from_cache(cls, api_key):
         try:
@@ -107,13 +106,21 @@ class Environment(LifecycleModel):
                     "project",
                     "project__organisation",
                     "amplitude_config",
+                    "segment_config",
+                    "heap_config",
+                    "mixpanel_config",
                 )
                 environment = cls.objects.select_related(*select_related_args).get(
                     api_key=api_key
                 )
-                # TODO: replace the hard coded cache timeout with an environment variable
-                #  until we merge in the pulumi stuff, however, we'll have too many conflicts
-                environment_cache.set(environment.api_key, environment, timeout=60)
+                # the related project and organisation are cached along with the
+                # environment so that authenticating SDK requests (which checks
+                # organisation.stop_serving_flags) doesn't hit the database
+                environment_cache.set(
+                    environment.api_key,
+                    environment,
+                    timeout=settings.ENVIRONMENT_CACHE_SECONDS,
+                )
             return environment
         except cls.DoesNotExist:
             logger.info("Environment with api_key %s does not exist" % api_key)
@@ -43,7 +43,7 @@ class EnvironmentPermissions(BasePermission):
             return False
 
     def has_object_permission(self, request, view, obj):
-        if request.user.is_admin(obj.project.organisation):
+        if request.user.is_admin(obj.project.organisation_id):
             return True
 
         if request.user.is_environment_admin(obj):
@@ -73,7 +73,7 @@ class IdentityPermissions(BasePermission):
             return False
 
     def has_object_permission(self, request, view, obj):
-        if request.user.is_admin(obj.environment.project.organisation):
+        if request.user.is_admin(obj.environment.project.organisation_id):
             return True
 
         if request.user.is_environment_admin(obj.environment):
@@ -89,7 +89,12 @@ class NestedEnvironmentPermissions(BasePermission):
             if not environment_api_key:
                 return False
 
-            environment = Environment.objects.get(api_key=environment_api_key)
+            if hasattr(view, "get_environment_from_request"):
+                # share the environment with the view rather than retrieving it
+                # again when creating the object
+                environment = view.get_environment_from_request()
+            else:
+                environment = Environment.objects.get(api_key=environment_api_key)
             return request.user.is_environment_admin(environment)
 
         if view.action == "list":
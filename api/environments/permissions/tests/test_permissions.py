@@ -213,6 +213,7 @@ class NestedEnvironmentPermissionsTestCase(TestCase):
         mock_view.detail = False
         mock_request.user = self.org_admin
         mock_view.kwargs = {"environment_api_key": self.environment.api_key}
+        mock_view.get_environment_from_request.return_value = self.environment
 
         # When
         result = nested_environment_permissions.has_permission(mock_request, mock_view)
@@ -228,6 +229,7 @@ class NestedEnvironmentPermissionsTestCase(TestCase):
         mock_view.action = "create"
         mock_view.detail = False
         mock_view.kwargs = {"environment_api_key": self.environment.api_key}
+        mock_view.get_environment_from_request.return_value = self.environment
         mock_request.user = self.user
 
         # When
@@ -242,6 +244,7 @@ class NestedEnvironmentPermissionsTestCase(TestCase):
         mock_view.detail = False
         mock_request.user = self.user
         mock_view.kwargs = {"environment_api_key": self.environment.api_key}
+        mock_view.get_environment_from_request.return_value = self.environment
 
         # When
         result = nested_environment_permissions.has_permission(mock_request, mock_view)
@@ -249,6 +252,38 @@ class NestedEnvironmentPermissionsTestCase(TestCase):
         # Then
         assert not result
 
+    def test_create_permission_uses_environment_from_view_if_available(self):
+        # Given
+        view = mock.MagicMock()
+        view.action = "create"
+        view.detail = False
+        view.kwargs = {"environment_api_key": self.environment.api_key}
+        view.get_environment_from_request.return_value = self.environment
+        mock_request.user = self.org_admin
+
+        # When
+        result = nested_environment_permissions.has_permission(mock_request, view)
+
+        # Then
+        assert result
+        view.get_environment_from_request.assert_called_once_with()
+
+    def test_create_permission_retrieves_environment_if_view_does_not_provide_it(
+        self,
+    ):
+        # Given
+        view = mock.MagicMock(spec=["action", "detail", "kwargs"])
+        view.action = "create"
+        view.detail = False
+        view.kwargs = {"environment_api_key": self.environment.api_key}
+        mock_request.user = self.org_admin
+
+        # When
+        result = nested_environment_permissions.has_permission(mock_request, view)
+
+        # Then
+        assert result
+
     def test_organisation_admin_has_destroy_permission(self):
         # Given
         mock_view.action = "destroy"
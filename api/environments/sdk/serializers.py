@@ -68,6 +68,13 @@ class IdentifyWithTraitsSerializer(serializers.Serializer):
     traits = TraitSerializerBasic(required=False, many=True)
     flags = FeatureStateSerializerFull(read_only=True, many=True)
 
+    def to_representation(self, instance):
+        # the flags serializer needs the identity to determine the correct value
+        # for multivariate features so we make it available here rather than
+        # requiring the response to be serialized again by the view
+        self.context["identity"] = instance["identity"]
+        return super().to_representation(instance)
+
     def create(self, validated_data):
         """
         Create the identity with the associated traits
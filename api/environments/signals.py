@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from environments.models import Environment, environment_cache
+from integrations.amplitude.models import AmplitudeConfiguration
+from integrations.heap.models import HeapConfiguration
+from integrations.mixpanel.models import MixpanelConfiguration
+from integrations.segment.models import SegmentConfiguration
+from organisations.models import Organisation
+
+
+@receiver(post_save, sender=Organisation)
+def clear_organisation_environments_cache(sender, instance, *args, **kwargs):
+    # cached environments hold a copy of their organisation (e.g. to check
+    # stop_serving_flags) so they need to be evicted when it changes. Note that the
+    # environment cache is local to each process so other processes will keep
+    # their copy for up to ENVIRONMENT_CACHE_SECONDS.
+    api_keys = Environment.objects.filter(project__organisation=instance).values_list(
+        "api_key", flat=True
+    )
+    environment_cache.delete_many(list(api_keys))
+
+
+@receiver(post_save, sender=AmplitudeConfiguration)
+@receiver(post_delete, sender=AmplitudeConfiguration)
+@receiver(post_save, sender=HeapConfiguration)
+@receiver(post_delete, sender=HeapConfiguration)
+@receiver(post_save, sender=MixpanelConfiguration)
+@receiver(post_delete, sender=MixpanelConfiguration)
+@receiver(post_save, sender=SegmentConfiguration)
+@receiver(post_delete, sender=SegmentConfiguration)
+def clear_integration_environment_cache(sender, instance, *args, **kwargs):
+    # cached environments hold a copy of their identity integration configurations
+    environment_cache.delete(instance.environment.api_key)
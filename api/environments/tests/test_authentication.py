@@ -5,7 +5,9 @@ import pytest
 from axes.models import AccessAttempt
 from django.conf import settings
 from django.contrib.auth import authenticate
+from django.db import connection
 from django.http import HttpRequest
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import AuthenticationFailed
 
 from environments.authentication import EnvironmentKeyAuthentication
@@ -73,6 +75,41 @@ class EnvironmentKeyAuthenticationTestCase(TestCase):
         with pytest.raises(AuthenticationFailed):
             self.authenticator.authenticate(request)
 
+    def test_authenticate_raises_authentication_failed_if_organisation_stops_serving_flags_after_environment_cached(
+        self,
+    ):
+        # Given
+        request = MagicMock()
+        request.META.get.return_value = self.environment.api_key
+
+        # the environment is cached on the first request
+        self.authenticator.authenticate(request)
+
+        # When
+        self.organisation.stop_serving_flags = True
+        self.organisation.save()
+
+        # Then
+        with pytest.raises(AuthenticationFailed):
+            self.authenticator.authenticate(request)
+
+    def test_authenticate_does_not_query_the_database_once_environment_is_cached(
+        self,
+    ):
+        # Given
+        request = MagicMock()
+        request.META.get.return_value = self.environment.api_key
+
+        # the environment is cached on the first request
+        self.authenticator.authenticate(request)
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            self.authenticator.authenticate(request)
+
+        # Then
+        assert len(queries) == 0
+
 
 @pytest.mark.django_db
 class TestBruteForceAttempts(TestCase):
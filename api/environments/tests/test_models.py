@@ -133,6 +133,18 @@ class EnvironmentTestCase(TestCase):
             self.environment.api_key, self.environment, timeout=60
         )
 
+    @mock.patch("environments.models.environment_cache")
+    def test_updating_environment_clears_it_from_the_cache(self, mock_cache):
+        # Given
+        self.environment.save()
+
+        # When
+        self.environment.name = "Updated environment"
+        self.environment.save()
+
+        # Then
+        mock_cache.delete.assert_called_once_with(self.environment.api_key)
+
     def test_get_from_cache_returns_None_if_no_matching_environment(self):
         # Given
         api_key = "no-matching-env"
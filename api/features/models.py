@@ -271,32 +271,37 @@ class FeatureState(LifecycleModel, models.Model):
         :param other: (FeatureState) the feature state to compare the priority of
         :return: True if self is higher priority than other
         """
-        if self.environment != other.environment:
+        # Note: we compare the foreign key ids where possible (rather than the related
+        # objects) to avoid additional queries when this is used to determine the
+        # flags for an identity
+        if self.environment_id != other.environment_id:
             raise ValueError(
                 "Cannot compare feature states as they belong to different environments."
             )
 
-        if self.feature != other.feature:
+        if self.feature_id != other.feature_id:
             raise ValueError(
                 "Cannot compare feature states as they belong to different features."
             )
 
-        if self.identity:
+        if self.identity_id:
             # identity is the highest priority so we can always return true
-            if other.identity and self.identity != other.identity:
+            if other.identity_id and self.identity_id != other.identity_id:
                 raise ValueError(
                     "Cannot compare feature states as they are for different identities."
                 )
             return True
 
-        if self.feature_segment:
+        if self.feature_segment_id:
             # Return true if other_feature_state has a lower priority feature segment and not an identity overridden
             # flag, else False.
-            return not (other.identity or self.feature_segment < other.feature_segment)
+            return not (
+                other.identity_id or self.feature_segment < other.feature_segment
+            )
 
         # if we've reached here, then self is just the environment default. In this case, other is higher priority if
         # it has a feature_segment or an identity
-        return not (other.feature_segment or other.identity)
+        return not (other.feature_segment_id or other.identity_id)
 
     def clone(self, env: "Environment") -> "FeatureState":
         # Clonning the Identity is not allowed because they are closely tied
@@ -339,9 +344,7 @@ class FeatureState(LifecycleModel, models.Model):
         # avoid further queries to the DB
         mv_options = list(self.multivariate_feature_state_values.all())
 
-        percentage_value = (
-            get_hashed_percentage_for_object_ids([self.id, identity.id]) * 100
-        )
+        percentage_value = self._get_percentage_value_for_identity(identity)
 
         # Iterate over the mv options in order of id (so we get the same value each
         # time) to determine the correct value to return to the identity based on
@@ -361,6 +364,20 @@ class FeatureState(LifecycleModel, models.Model):
         # if there isn't one - although this should never happen)
         return getattr(self, "feature_state_value", None)
 
+    def _get_percentage_value_for_identity(self, identity: "Identity") -> float:
+        # the same feature state is often evaluated for the same identity several
+        # times in a single request (e.g. when serializing the response and again
+        # for each identity integration) so we store the hashed percentage on the
+        # instance to avoid recalculating it each time. The id of the feature state
+        # is part of the key since clones copy the instance (including its id).
+        percentage_values = self.__dict__.setdefault("_identity_percentage_values", {})
+        key = (self.id, identity.id)
+        if key not in percentage_values:
+            percentage_values[key] = (
+                get_hashed_percentage_for_object_ids([self.id, identity.id]) * 100
+            )
+        return percentage_values[key]
+
     @property
     def previous_feature_state_value(self):
         try:
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest import mock
 
 import pytest
@@ -280,6 +281,28 @@ class FeatureStateTest(TestCase):
         # and feature state with any segment is greater than default environment state
         assert segment_2_state > default_env_state
 
+    def test_feature_state_gt_operator_does_not_query_related_objects(self):
+        # Given
+        identity = Identity.objects.create(
+            identifier="test_identity", environment=self.environment
+        )
+        FeatureState.objects.create(
+            identity=identity, feature=self.feature, environment=self.environment
+        )
+        identity_state = FeatureState.objects.get(
+            environment=self.environment, feature=self.feature, identity=identity
+        )
+        default_env_state = FeatureState.objects.get(
+            environment=self.environment, feature=self.feature, identity=None
+        )
+
+        # When
+        with self.assertNumQueries(0):
+            result = identity_state > default_env_state
+
+        # Then
+        assert result is True
+
     def test_feature_state_gt_operator_throws_value_error_if_different_environments(
         self,
     ):
@@ -384,6 +407,62 @@ def test_get_multivariate_value_returns_correct_value_when_we_pass_identity(
     assert multivariate_value.value != multivariate_value.initial_value
 
 
+@mock.patch("features.models.get_hashed_percentage_for_object_ids")
+def test_get_multivariate_value_only_calculates_hashed_percentage_once_per_identity(
+    mock_get_hashed_percentage,
+    multivariate_feature,
+    environment,
+    identity,
+):
+    # Given
+    mock_get_hashed_percentage.return_value = 0.5
+    feature_state = FeatureState.objects.get(
+        environment=environment,
+        feature=multivariate_feature,
+        identity=None,
+        feature_segment=None,
+    )
+
+    # When
+    first_value = feature_state.get_multivariate_feature_state_value(identity=identity)
+    second_value = feature_state.get_multivariate_feature_state_value(identity=identity)
+
+    # Then
+    assert first_value == second_value
+    mock_get_hashed_percentage.assert_called_once_with([feature_state.id, identity.id])
+
+
+@mock.patch("features.models.get_hashed_percentage_for_object_ids")
+def test_get_multivariate_value_calculates_hashed_percentage_for_copied_feature_state(
+    mock_get_hashed_percentage,
+    multivariate_feature,
+    environment,
+    identity,
+):
+    # Given
+    mock_get_hashed_percentage.return_value = 0.5
+    feature_state = FeatureState.objects.get(
+        environment=environment,
+        feature=multivariate_feature,
+        identity=None,
+        feature_segment=None,
+    )
+    feature_state.get_multivariate_feature_state_value(identity=identity)
+
+    # a copy with a different id, as made when cloning a feature state
+    copied_feature_state = deepcopy(feature_state)
+    copied_feature_state.id = feature_state.id + 1
+
+    # When
+    copied_feature_state.get_multivariate_feature_state_value(identity=identity)
+
+    # Then
+    mock_get_hashed_percentage.assert_called_with(
+        [copied_feature_state.id, identity.id]
+    )
+    assert mock_get_hashed_percentage.call_count == 2
+
+
 @mock.patch.object(FeatureState, "get_multivariate_feature_state_value")
 def test_get_feature_state_value_for_multivariate_features(
     mock_get_mv_feature_state_value, environment, multivariate_feature, identity
@@ -4,7 +4,9 @@ from unittest import TestCase, mock
 
 import pytest
 import pytz
+from django.db import connection
 from django.forms import model_to_dict
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -825,6 +827,37 @@ class FeatureStateViewSetTestCase(TestCase):
         # and
         assert res.json()["results"][0]["identity"]["identifier"] == identifier
 
+    def test_list_feature_states_query_count_does_not_grow_with_number_of_flags(
+        self,
+    ):
+        # Given
+        url = reverse(
+            "api-v1:environments:environment-featurestates-list",
+            args=[self.environment.api_key],
+        )
+
+        with CaptureQueriesContext(connection) as single_flag_queries:
+            single_flag_response = self.client.get(url)
+
+        for i in range(5):
+            Feature.objects.create(
+                name=f"another-feature-{i}",
+                project=self.project,
+                type="CONFIG",
+                initial_value=i,
+            )
+
+        # When
+        with CaptureQueriesContext(connection) as multiple_flags_queries:
+            multiple_flags_response = self.client.get(url)
+
+        # Then
+        assert len(single_flag_response.json()["results"]) == 1
+        assert len(multiple_flags_response.json()["results"]) == 6
+
+        # and
+        assert len(multiple_flags_queries) == len(single_flag_queries)
+
 
 @pytest.mark.django_db
 class SDKFeatureStatesTestCase(APITestCase):
@@ -924,6 +957,38 @@ class SDKFeatureStatesTestCase(APITestCase):
         # but enabled ones are
         assert response_json[0]["feature"]["id"] == enabled_flag.id
 
+    def test_get_flags_returns_304_if_response_not_modified(self):
+        # Given
+        first_response = self.client.get(self.url)
+
+        # When
+        second_response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        # Then
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_get_flags_returns_200_if_response_modified(self):
+        # Given
+        first_response = self.client.get(self.url)
+
+        FeatureState.objects.filter(
+            environment=self.environment,
+            feature=self.feature,
+            identity=None,
+            feature_segment=None,
+        ).update(enabled=True)
+
+        # When
+        second_response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        # Then
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.json()[0]["enabled"] is True
+
 
 @pytest.mark.django_db
 class SimpleFeatureStateViewSetTestCase(TestCase):
@@ -5,6 +5,7 @@ from app_analytics.influxdb_wrapper import get_multiple_event_list_for_feature
 from django.conf import settings
 from django.core.cache import caches
 from django.utils.decorators import method_decorator
+from django.views.decorators.http import conditional_page
 from drf_yasg2 import openapi
 from drf_yasg2.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
@@ -192,7 +193,12 @@ class BaseFeatureStateViewSet(viewsets.ModelViewSet):
                 feature__id=int(self.request.query_params.get("feature"))
             )
 
-        return queryset
+        # the serializers render the value, identity and multivariate values of
+        # each feature state (and the value lookup reads the feature type) so load
+        # them up front to avoid a query per flag
+        return queryset.select_related(
+            "feature", "feature_state_value", "identity"
+        ).prefetch_related("multivariate_feature_state_values")
 
     def get_environment_from_request(self):
         """
@@ -217,10 +223,7 @@ class BaseFeatureStateViewSet(viewsets.ModelViewSet):
         """
         data = request.data
         environment = self.get_environment_from_request()
-        if (
-            environment.project.organisation
-            not in self.request.user.organisations.all()
-        ):
+        if not self.request.user.belongs_to(environment.project.organisation_id):
             return Response(status.HTTP_403_FORBIDDEN)
 
         data["environment"] = environment.id
@@ -375,6 +378,8 @@ class SimpleFeatureStateViewSet(
         )
 
 
+# see SDKAPIView, the ETag only saves bandwidth for polling SDKs
+@method_decorator(conditional_page, name="dispatch")
 class SDKFeatureStates(GenericAPIView):
     serializer_class = FeatureStateSerializerFull
     permission_classes = (EnvironmentKeyPermissions,)
@@ -2,8 +2,6 @@ from django.conf import settings
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import BasePermission
 
-from organisations.models import Organisation
-
 CREATE_PROJECT = "CREATE_PROJECT"
 
 ORGANISATION_PERMISSIONS = (
@@ -11,12 +9,16 @@ ORGANISATION_PERMISSIONS = (
 )
 
 
+def _is_organisation_admin(user, organisation_pk) -> bool:
+    # only the id of the organisation is needed to check the user's role so we
+    # avoid retrieving the organisation itself
+    return bool(organisation_pk) and int(organisation_pk) in user.admin_organisation_ids
+
+
 class NestedOrganisationEntityPermission(BasePermission):
     def has_permission(self, request, view):
         organisation_pk = view.kwargs.get("organisation_pk")
-        if organisation_pk and request.user.is_admin(
-            Organisation.objects.get(pk=organisation_pk)
-        ):
+        if _is_organisation_admin(request.user, organisation_pk):
             return True
 
         raise PermissionDenied(
@@ -25,8 +27,7 @@ class NestedOrganisationEntityPermission(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         organisation_id = view.kwargs.get("organisation_pk")
-        organisation = Organisation.objects.get(id=organisation_id)
-        return request.user.is_admin(organisation)
+        return _is_organisation_admin(request.user, organisation_id)
 
 
 class OrganisationPermission(BasePermission):
@@ -37,7 +38,7 @@ class OrganisationPermission(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         if request.user.is_admin(obj) or (
-            view.action == "my_permissions" and obj in request.user.organisations.all()
+            view.action == "my_permissions" and obj.id in request.user.organisation_ids
         ):
             return True
 
@@ -49,21 +50,19 @@ class OrganisationPermission(BasePermission):
 class OrganisationUsersPermission(BasePermission):
     def has_permission(self, request, view):
         organisation_id = view.kwargs.get("organisation_pk")
-        organisation = Organisation.objects.get(id=organisation_id)
 
-        if request.user.is_admin(organisation):
+        if _is_organisation_admin(request.user, organisation_id):
             return True
 
-        if view.action == "list" and request.user.belongs_to(organisation.id):
+        if view.action == "list" and request.user.belongs_to(int(organisation_id)):
             return True
 
         return False
 
     def has_object_permission(self, request, view, obj):
         organisation_id = view.kwargs.get("organisation_pk")
-        organisation = Organisation.objects.get(id=organisation_id)
 
-        if request.user.is_admin(organisation):
+        if _is_organisation_admin(request.user, organisation_id):
             return True
 
         return False
@@ -72,9 +71,7 @@ class OrganisationUsersPermission(BasePermission):
 class UserPermissionGroupPermission(BasePermission):
     def has_permission(self, request, view):
         organisation_pk = view.kwargs.get("organisation_pk")
-        if organisation_pk and request.user.is_admin(
-            Organisation.objects.get(pk=organisation_pk)
-        ):
+        if _is_organisation_admin(request.user, organisation_pk):
             return True
 
         if view.action == "list" and request.user.belongs_to(int(organisation_pk)):
@@ -84,9 +81,8 @@ class UserPermissionGroupPermission(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         organisation_id = view.kwargs.get("organisation_pk")
-        organisation = Organisation.objects.get(id=organisation_id)
 
-        if request.user.is_admin(organisation):
+        if _is_organisation_admin(request.user, organisation_id):
             return True
 
         return False
@@ -41,7 +41,9 @@ class Project(models.Model):
     def get_segments_from_cache(self):
         segments = project_segments_cache.get(self.id)
 
-        if not segments:
+        # check for None explicitly so that projects without any segments are
+        # also served from the cache
+        if segments is None:
             # This is optimised to account for rules nested one levels deep (since we
             # don't support anything above that from the UI at the moment). Anything
             # past that will require additional queries / thought on how to optimise.
@@ -52,9 +54,12 @@ class Project(models.Model):
                 "rules__rules__conditions",
                 "rules__rules__rules",
             )
-            project_segments_cache.set(
-                self.id, segments, timeout=settings.CACHE_PROJECT_SEGMENTS_SECONDS
-            )
+            if settings.CACHE_PROJECT_SEGMENTS_SECONDS > 0:
+                # avoid the cost of pickling the segments (and all their rules and
+                # conditions) on every request when the cache is disabled
+                project_segments_cache.set(
+                    self.id, segments, timeout=settings.CACHE_PROJECT_SEGMENTS_SECONDS
+                )
 
         return segments
 
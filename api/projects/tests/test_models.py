@@ -1,12 +1,13 @@
 from unittest import mock
 
 import pytest
-from django.conf import settings
 
 
 @pytest.mark.django_db()
-def test_get_segments_from_cache(project, monkeypatch):
+def test_get_segments_from_cache(project, monkeypatch, settings):
     # Given
+    settings.CACHE_PROJECT_SEGMENTS_SECONDS = 60
+
     mock_project_segments_cache = mock.MagicMock()
     mock_project_segments_cache.get.return_value = None
 
@@ -43,3 +44,42 @@ def test_get_segments_from_cache_set_not_called(project, segments, monkeypatch):
     # And correct calls to cache are made
     mock_project_segments_cache.get.assert_called_once_with(project.id)
     mock_project_segments_cache.set.assert_not_called()
+
+
+@pytest.mark.django_db()
+def test_get_segments_from_cache_set_not_called_if_cache_disabled(
+    project, monkeypatch, settings
+):
+    # Given
+    settings.CACHE_PROJECT_SEGMENTS_SECONDS = 0
+
+    mock_project_segments_cache = mock.MagicMock()
+    mock_project_segments_cache.get.return_value = None
+
+    monkeypatch.setattr(
+        "projects.models.project_segments_cache", mock_project_segments_cache
+    )
+
+    # When
+    project.get_segments_from_cache()
+
+    # Then
+    mock_project_segments_cache.set.assert_not_called()
+
+
+@pytest.mark.django_db()
+def test_get_segments_from_cache_returns_cached_empty_segments(project, monkeypatch):
+    # Given
+    mock_project_segments_cache = mock.MagicMock()
+    mock_project_segments_cache.get.return_value = []
+
+    monkeypatch.setattr(
+        "projects.models.project_segments_cache", mock_project_segments_cache
+    )
+
+    # When
+    segments = project.get_segments_from_cache()
+
+    # Then
+    assert segments == []
+    mock_project_segments_cache.set.assert_not_called()
@@ -7,6 +7,7 @@ from django.utils.encoding import python_2_unicode_compatible
 
 from environments.identities.helpers import (
     get_hashed_percentage_for_object_ids,
+    get_traits_by_key,
 )
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
@@ -41,7 +42,7 @@ class Segment(models.Model):
         return "Segment - %s" % self.name
 
     def does_identity_match(
-        self, identity: Identity, traits: typing.List[Trait] = None
+        self, identity: Identity, traits: typing.Dict[str, Trait] = None
     ) -> bool:
         rules = self.rules.all()
         return rules.count() > 0 and all(
@@ -82,7 +83,7 @@ class SegmentRule(models.Model):
         )
 
     def does_identity_match(
-        self, identity: Identity, traits: typing.List[Trait] = None
+        self, identity: Identity, traits: typing.Dict[str, Trait] = None
     ) -> bool:
         matches_conditions = False
         conditions = self.conditions.all()
@@ -154,25 +155,28 @@ class Condition(models.Model):
         )
 
     def does_identity_match(
-        self, identity: Identity, traits: typing.List[Trait] = None
+        self, identity: Identity, traits: typing.Dict[str, Trait] = None
     ) -> bool:
         if self.operator == PERCENTAGE_SPLIT:
             return self._check_percentage_split_operator(identity)
 
         # we allow passing in traits to handle when they aren't
         # persisted for certain organisations
-        traits = identity.identity_traits.all() if traits is None else traits
-
-        for trait in traits:
-            if trait.trait_key == self.property:
-                if trait.value_type == INTEGER:
-                    return self.check_integer_value(trait.integer_value)
-                if trait.value_type == FLOAT:
-                    return self.check_float_value(trait.float_value)
-                elif trait.value_type == BOOLEAN:
-                    return self.check_boolean_value(trait.boolean_value)
-                else:
-                    return self.check_string_value(trait.string_value)
+        if traits is None:
+            traits = get_traits_by_key(identity.identity_traits.all())
+
+        trait = traits.get(self.property)
+        if trait is None:
+            return None
+
+        if trait.value_type == INTEGER:
+            return self.check_integer_value(trait.integer_value)
+        if trait.value_type == FLOAT:
+            return self.check_float_value(trait.float_value)
+        elif trait.value_type == BOOLEAN:
+            return self.check_boolean_value(trait.boolean_value)
+        else:
+            return self.check_string_value(trait.string_value)
 
     def _check_percentage_split_operator(self, identity):
         try:
@@ -1,12 +1,51 @@
-import json
+import copy
 import uuid
+from functools import lru_cache
 
 import pytest
 from django.test import Client as DjangoClient
-from django.urls import reverse
-from rest_framework.test import APIClient
+from django.urls import ResolverMatch, resolve, reverse
+from rest_framework import status
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from app.utils import create_hash
+from organisations.models import Organisation, OrganisationRole
+from projects.models import Project, UserProjectPermission
+
+
+@lru_cache(maxsize=None)
+def _reverse(viewname: str) -> str:
+    # the fixtures below resolve the same argument-free urls for every test so we
+    # only want to look each of them up once
+    return reverse(viewname)
+
+
+@lru_cache(maxsize=None)
+def _resolve(viewname: str) -> ResolverMatch:
+    return resolve(_reverse(viewname))
+
+
+_request_factory = APIRequestFactory()
+
+
+def _create_with_view(url: str, data: dict, user, match: ResolverMatch = None) -> int:
+    """
+    Create an object by calling the view for the given url directly. This keeps
+    any side effects of creating the object through the API (e.g. audit logs)
+    without the overhead of the full request / response cycle.
+
+    :param match: the resolved url, if already known, to save resolving it again
+    """
+    request = _request_factory.post(url, data=data, format="json")
+    force_authenticate(request, user=user)
+    match = match or resolve(url)
+    response = match.func(request, *match.args, **match.kwargs)
+    assert response.status_code == status.HTTP_201_CREATED, response.data
+    return response.data["id"]
 
 
 @pytest.fixture()
@@ -26,31 +65,32 @@ def admin_client(api_client, admin_user):
 
 
 @pytest.fixture()
-def organisation(admin_client):
-    organisation_data = {"name": "Test org"}
-    url = reverse("api-v1:organisations:organisation-list")
-    response = admin_client.post(url, data=organisation_data)
-    return response.json()["id"]
+def organisation(admin_user):
+    # created directly rather than through the API since creating an organisation
+    # has no side effects other than adding the user to it
+    organisation = Organisation.objects.create(name="Test org")
+    admin_user.add_organisation(organisation, OrganisationRole.ADMIN)
+    return organisation.id
+
+
+def _create_project(user, organisation: int, **kwargs) -> int:
+    # created directly rather than through the API, so we give the user the admin
+    # permission that the API would give to the creator of the project
+    project = Project.objects.create(
+        name="Test Project", organisation_id=organisation, **kwargs
+    )
+    UserProjectPermission.objects.create(user=user, project=project, admin=True)
+    return project.id
 
 
 @pytest.fixture()
-def project(admin_client, organisation):
-    project_data = {"name": "Test Project", "organisation": organisation}
-    url = reverse("api-v1:projects:project-list")
-    response = admin_client.post(url, data=project_data)
-    return response.json()["id"]
+def project(admin_user, organisation):
+    return _create_project(admin_user, organisation)
 
 
 @pytest.fixture()
-def dynamo_enabled_project(admin_client, organisation):
-    project_data = {
-        "name": "Test Project",
-        "organisation": organisation,
-        "enable_dynamo_db": True,
-    }
-    url = reverse("api-v1:projects:project-list")
-    response = admin_client.post(url, data=project_data)
-    return response.json()["id"]
+def dynamo_enabled_project(admin_user, organisation):
+    return _create_project(admin_user, organisation, enable_dynamo_db=True)
 
 
 @pytest.fixture()
@@ -58,155 +98,155 @@ def environment_api_key():
     return create_hash()
 
 
-@pytest.fixture()
-def environment(admin_client, project, environment_api_key) -> int:
+def _create_environment(user, project: int, api_key: str) -> int:
     environment_data = {
         "name": "Test Environment",
-        "api_key": environment_api_key,
+        "api_key": api_key,
         "project": project,
     }
-    url = reverse("api-v1:environments:environment-list")
+    url = _reverse("api-v1:environments:environment-list")
+    match = _resolve("api-v1:environments:environment-list")
+    return _create_with_view(url, environment_data, user, match)
 
-    response = admin_client.post(url, data=environment_data)
-    return response.json()["id"]
+
+@pytest.fixture()
+def environment(admin_user, project, environment_api_key) -> int:
+    return _create_environment(admin_user, project, environment_api_key)
 
 
 @pytest.fixture()
 def dynamo_enabled_environment(
-    admin_client, dynamo_enabled_project, environment_api_key
+    admin_user, dynamo_enabled_project, environment_api_key
 ) -> int:
-    environment_data = {
-        "name": "Test Environment",
-        "api_key": environment_api_key,
-        "project": dynamo_enabled_project,
-    }
-    url = reverse("api-v1:environments:environment-list")
-
-    response = admin_client.post(url, data=environment_data)
-    return response.json()["id"]
+    return _create_environment(admin_user, dynamo_enabled_project, environment_api_key)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def identity_identifier():
     return uuid.uuid4()
 
 
 @pytest.fixture()
-def identity(admin_client, identity_identifier, environment, environment_api_key):
-    identity_data = {"identifier": identity_identifier}
+def identity(admin_user, identity_identifier, environment, environment_api_key):
+    identity_data = {"identifier": str(identity_identifier)}
     url = reverse(
         "api-v1:environments:environment-identities-list", args=[environment_api_key]
     )
-    response = admin_client.post(url, data=identity_data)
-    return response.json()["id"]
+    return _create_with_view(url, identity_data, admin_user)
+
+
+@pytest.fixture(scope="session")
+def _sdk_client():
+    return APIClient()
 
 
 @pytest.fixture()
-def sdk_client(environment_api_key):
-    client = APIClient()
-    client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key)
-    return client
+def sdk_client(_sdk_client, environment_api_key):
+    # the client is shared across the session, setting the credentials replaces
+    # those from any previous test
+    _sdk_client.cookies.clear()
+    _sdk_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key)
+    return _sdk_client
 
 
 @pytest.fixture()
-def feature(admin_client, project):
+def feature(admin_user, project):
     data = {
         "name": "test feature",
         "initial_value": "default_value",
         "project": project,
     }
     url = reverse("api-v1:projects:project-features-list", args=[project])
-
-    response = admin_client.post(url, data=data)
-    return response.json()["id"]
+    return _create_with_view(url, data, admin_user)
 
 
 @pytest.fixture()
-def segment(admin_client, project):
+def segment(admin_user, project):
     url = reverse("api-v1:projects:project-segments-list", args=[project])
     data = {
         "name": "Test Segment",
         "project": project,
         "rules": [{"type": "ALL", "rules": [], "conditions": []}],
     }
-
-    response = admin_client.post(
-        url, data=json.dumps(data), content_type="application/json"
-    )
-    return response.json()["id"]
+    return _create_with_view(url, data, admin_user)
 
 
 @pytest.fixture()
-def feature_segment(admin_client, segment, feature, environment):
+def feature_segment(admin_user, segment, feature, environment):
     data = {
         "feature": feature,
         "segment": segment,
         "environment": environment,
     }
-    url = reverse("api-v1:features:feature-segment-list")
-
-    response = admin_client.post(
-        url, data=json.dumps(data), content_type="application/json"
-    )
-    return response.json()["id"]
-
-
-@pytest.fixture()
-def identity_document(environment_api_key):
-    _environment_feature_state_1_document = {
-        "multivariate_feature_state_values": [],
-        "feature_state_value": "feature_1_value",
+    url = _reverse("api-v1:features:feature-segment-list")
+    match = _resolve("api-v1:features:feature-segment-list")
+    return _create_with_view(url, data, admin_user, match)
+
+
+_environment_feature_state_1_document = {
+    "multivariate_feature_state_values": [],
+    "feature_state_value": "feature_1_value",
+    "id": 1,
+    "feature": {
+        "name": "feature_1",
+        "type": "STANDARD",
         "id": 1,
-        "feature": {
-            "name": "feature_1",
-            "type": "STANDARD",
+    },
+    "enabled": False,
+}
+_environment_feature_state_2_document = {
+    "multivariate_feature_state_values": [],
+    "feature_state_value": "2.3",
+    "id": 2,
+    "feature": {
+        "name": "feature_2",
+        "type": "STANDARD",
+        "id": 2,
+    },
+    "enabled": True,
+}
+_mv_feature_state_document = {
+    "multivariate_feature_state_values": [
+        {
+            "percentage_allocation": 50,
+            "multivariate_feature_option": {"value": "50_percent"},
             "id": 1,
         },
-        "enabled": False,
-    }
-    _environment_feature_state_2_document = {
-        "multivariate_feature_state_values": [],
-        "feature_state_value": "2.3",
-        "id": 2,
-        "feature": {
-            "name": "feature_2",
-            "type": "STANDARD",
+        {
+            "percentage_allocation": 50,
+            "multivariate_feature_option": {"value": "other_50_percent"},
             "id": 2,
         },
-        "enabled": True,
-    }
-    _mv_feature_state_document = {
-        "multivariate_feature_state_values": [
-            {
-                "percentage_allocation": 50,
-                "multivariate_feature_option": {"value": "50_percent"},
-                "id": 1,
-            },
-            {
-                "percentage_allocation": 50,
-                "multivariate_feature_option": {"value": "other_50_percent"},
-                "id": 2,
-            },
-        ],
-        "feature_state_value": None,
+    ],
+    "feature_state_value": None,
+    "id": 4,
+    "feature": {
+        "name": "multivariate_feature",
+        "type": "MULTIVARIATE",
         "id": 4,
-        "feature": {
-            "name": "multivariate_feature",
-            "type": "MULTIVARIATE",
-            "id": 4,
-        },
-        "enabled": False,
-    }
-    return {
-        "composite_key": f"{environment_api_key}_user_1_test",
-        "identity_traits": [{"trait_value": "test", "trait_key": "first_name"}],
-        "identity_features": [
-            _environment_feature_state_1_document,
-            _environment_feature_state_2_document,
-            _mv_feature_state_document,
-        ],
-        "identifier": "user_1_test",
-        "created_date": "2021-09-21T10:12:42.230257+00:00",
-        "environment_api_key": environment_api_key,
-        "identity_uuid": "59efa2a7-6a45-46d6-b953-a7073a90eacf",
-    }
+    },
+    "enabled": False,
+}
+_IDENTITY_DOCUMENT_TEMPLATE = {
+    # composite_key and environment_api_key are set by the identity_document fixture
+    "composite_key": None,
+    "identity_traits": [{"trait_value": "test", "trait_key": "first_name"}],
+    "identity_features": [
+        _environment_feature_state_1_document,
+        _environment_feature_state_2_document,
+        _mv_feature_state_document,
+    ],
+    "identifier": "user_1_test",
+    "created_date": "2021-09-21T10:12:42.230257+00:00",
+    "environment_api_key": None,
+    "identity_uuid": "59efa2a7-6a45-46d6-b953-a7073a90eacf",
+}
+
+
+@pytest.fixture()
+def identity_document(environment_api_key):
+    # views may modify the document they are given so each test gets its own copy
+    identity_document = copy.deepcopy(_IDENTITY_DOCUMENT_TEMPLATE)
+    identity_document["composite_key"] = f"{environment_api_key}_user_1_test"
+    identity_document["environment_api_key"] = environment_api_key
+    return identity_document
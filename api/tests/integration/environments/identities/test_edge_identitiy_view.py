@@ -68,17 +68,14 @@ def test_create_identity(
         "api-v1:environments:environment-edge-identities-list",
         args=[environment_api_key],
     )
-    dynamo_wrapper_mock.get_item.return_value = None
+    dynamo_wrapper_mock.put_item_if_not_exists.return_value = True
 
     # When
     response = admin_client.post(url, data={"identifier": identifier})
 
-    # Then, test that get_item was called to verify that identity does not exists already
-    dynamo_wrapper_mock.get_item.assert_called_with(composite_key)
-
-    # Next, let verify that put item was called with correct args
-    name, args, _ = dynamo_wrapper_mock.mock_calls[1]
-    assert name == "put_item"
+    # Then, let verify that put item was called with correct args
+    name, args, _ = dynamo_wrapper_mock.mock_calls[0]
+    assert name == "put_item_if_not_exists"
     assert args[0]["identifier"] == identifier
     assert args[0]["composite_key"] == composite_key
 
@@ -102,7 +99,7 @@ def test_create_identity_returns_400_if_identity_already_exists(
         "api-v1:environments:environment-edge-identities-list",
         args=[environment_api_key],
     )
-    dynamo_wrapper_mock.get_item.return_value = identity_document  # {
+    dynamo_wrapper_mock.put_item_if_not_exists.return_value = False
     response = admin_client.post(url, data={"identifier": identifier})
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -6,12 +6,12 @@ from django.urls import reverse
 from integrations.slack.slack import ChannelsDataResponse, SlackChannel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slack_bot_token():
     return "bot_token_test"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slack_channels_data_response():
     channels = [SlackChannel("name1", "id1"), SlackChannel("name2", "id2")]
     return ChannelsDataResponse(channels=channels, cursor="test_cursor")
@@ -52,7 +52,7 @@ def slack_environment_config(
         data=json.dumps(env_config),
         content_type="application/json",
     )
-    return response.json()["id"]
+    return response.data["id"]
 
 
 @pytest.fixture
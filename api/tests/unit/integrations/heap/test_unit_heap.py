@@ -19,7 +19,11 @@ def test_heap_when_generate_user_data_with_correct_values_then_success():
     project = Project.objects.create(name="Test Project", organisation=organisation)
     Environment.objects.create(name="Test Environment 1", project=project)
     feature = Feature.objects.create(name="Test Feature", project=project)
-    feature_states = FeatureState.objects.filter(feature=feature)
+    feature_states = list(
+        FeatureState.objects.filter(feature=feature).select_related(
+            "feature", "feature_state_value"
+        )
+    )
 
     # When
     user_data = heap_wrapper.generate_user_data(
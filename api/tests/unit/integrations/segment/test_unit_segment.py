@@ -30,7 +30,11 @@ def test_segment_when_generate_user_data_with_correct_values_then_success():
     project = Project.objects.create(name="Test Project", organisation=organisation)
     Environment.objects.create(name="Test Environment 1", project=project)
     feature = Feature.objects.create(name="Test Feature", project=project)
-    feature_states = FeatureState.objects.filter(feature=feature)
+    feature_states = list(
+        FeatureState.objects.filter(feature=feature).select_related(
+            "feature", "feature_state_value"
+        )
+    )
 
     # When
     user_data = segment_wrapper.generate_user_data(
@@ -38,16 +42,9 @@ def test_segment_when_generate_user_data_with_correct_values_then_success():
     )
 
     # Then
-    feature_properties = {}
-    for feature_state in feature_states:
-        value = feature_state.get_feature_state_value()
-        feature_properties[feature_state.feature.name] = (
-            value if (feature_state.enabled and value) else feature_state.enabled
-        )
-
     expected_user_data = {
         "user_id": identity.identifier,
-        "traits": feature_properties,
+        "traits": {"Test Feature": False},
     }
 
     assert expected_user_data == user_data
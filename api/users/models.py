@@ -8,6 +8,7 @@ from django.core.mail import send_mail
 from django.db import models
 from django.db.models import Q
 from django.utils.encoding import python_2_unicode_compatible
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_lifecycle import AFTER_CREATE, LifecycleModel, hook
 
@@ -132,8 +133,34 @@ class FFAdminUser(LifecycleModel, AbstractUser):
         self.add_organisation(organisation, role=OrganisationRole(invite.role))
         invite.delete()
 
-    def is_admin(self, organisation):
-        return self.get_organisation_role(organisation) == OrganisationRole.ADMIN.name
+    def is_admin(self, organisation: typing.Union[Organisation, int]) -> bool:
+        # accept the organisation id as well so that callers don't need to load
+        # the organisation just to check the user's role in it
+        organisation_id = getattr(organisation, "id", organisation)
+        return organisation_id in self.admin_organisation_ids
+
+    @cached_property
+    def admin_organisation_ids(self) -> typing.FrozenSet[int]:
+        """
+        Ids of the organisations that the user is an admin of. This is cached on
+        the instance so that checking permissions on several organisation
+        entities during a request only hits the database once.
+        """
+        return frozenset(
+            self.userorganisation_set.filter(
+                role=OrganisationRole.ADMIN.name
+            ).values_list("organisation_id", flat=True)
+        )
+
+    @cached_property
+    def organisation_ids(self) -> typing.FrozenSet[int]:
+        """
+        Ids of all the organisations that the user belongs to, cached on the
+        instance in the same way as admin_organisation_ids.
+        """
+        return frozenset(
+            self.userorganisation_set.values_list("organisation_id", flat=True)
+        )
 
     def get_admin_organisations(self):
         return Organisation.objects.filter(
@@ -148,9 +175,15 @@ class FFAdminUser(LifecycleModel, AbstractUser):
         UserOrganisation.objects.create(
             user=self, organisation=organisation, role=role.name
         )
+        self._clear_organisation_ids_cache()
 
     def remove_organisation(self, organisation):
         UserOrganisation.objects.filter(user=self, organisation=organisation).delete()
+        self._clear_organisation_ids_cache()
+
+    def _clear_organisation_ids_cache(self):
+        self.__dict__.pop("organisation_ids", None)
+        self.__dict__.pop("admin_organisation_ids", None)
 
     def get_organisation_role(self, organisation):
         user_organisation = self.get_user_organisation(organisation)
@@ -205,21 +238,21 @@ class FFAdminUser(LifecycleModel, AbstractUser):
         return Project.objects.filter(query).distinct()
 
     def has_project_permission(self, permission, project):
-        if self.is_project_admin(project) or self.is_admin(project.organisation):
+        if self.is_project_admin(project) or self.is_admin(project.organisation_id):
             return True
 
         return project in self.get_permitted_projects([permission])
 
     def has_environment_permission(self, permission, environment):
         if self.is_environment_admin(environment) or self.is_admin(
-            environment.project.organisation
+            environment.project.organisation_id
         ):
             return True
 
         return environment in self.get_permitted_environments([permission])
 
     def is_project_admin(self, project):
-        if self.is_admin(project.organisation):
+        if self.is_admin(project.organisation_id):
             return True
 
         return (
@@ -310,10 +343,10 @@ class FFAdminUser(LifecycleModel, AbstractUser):
         ]
 
     def belongs_to(self, organisation_id: int) -> bool:
-        return organisation_id in self.organisations.all().values_list("id", flat=True)
+        return organisation_id in self.organisation_ids
 
     def is_environment_admin(self, environment):
-        if self.is_admin(environment.project.organisation) or self.is_project_admin(
+        if self.is_admin(environment.project.organisation_id) or self.is_project_admin(
             environment.project
         ):
             return True
@@ -19,7 +19,7 @@ class UserIdSerializer(serializers.Serializer):
         organisation = Organisation.objects.get(pk=self.context.get("organisation"))
         user = self._get_user(validated_data)
 
-        if user and organisation in user.organisations.all():
+        if user and user.belongs_to(organisation.id):
             user.remove_organisation(organisation)
         user.permission_groups.remove(
             *UserPermissionGroup.objects.filter(organisation=organisation)
@@ -91,6 +91,57 @@ class FFAdminUserTestCase(TestCase):
         # Then
         assert self.organisation in admin_orgs
 
+    def test_is_admin_accepts_organisation_or_organisation_id(self):
+        # Given
+        self.user.add_organisation(self.organisation, OrganisationRole.ADMIN)
+
+        # Then
+        assert self.user.is_admin(self.organisation)
+        assert self.user.is_admin(self.organisation.id)
+
+    def test_is_admin_returns_false_for_organisation_user(self):
+        # Given
+        self.user.add_organisation(self.organisation, OrganisationRole.USER)
+
+        # Then
+        assert not self.user.is_admin(self.organisation)
+
+    def test_admin_organisation_ids(self):
+        # Given
+        another_organisation = Organisation.objects.create(name="Another org")
+        self.user.add_organisation(self.organisation, OrganisationRole.ADMIN)
+        self.user.add_organisation(another_organisation, OrganisationRole.USER)
+
+        # When
+        admin_organisation_ids = self.user.admin_organisation_ids
+
+        # Then
+        assert admin_organisation_ids == {self.organisation.id}
+
+    def test_admin_organisation_ids_is_refreshed_when_user_removed_from_organisation(
+        self,
+    ):
+        # Given
+        self.user.add_organisation(self.organisation, OrganisationRole.ADMIN)
+        assert self.organisation.id in self.user.admin_organisation_ids
+
+        # When
+        self.user.remove_organisation(self.organisation)
+
+        # Then
+        assert self.organisation.id not in self.user.admin_organisation_ids
+
+    def test_organisation_ids_is_refreshed_when_user_added_to_organisation(self):
+        # Given
+        assert not self.user.belongs_to(self.organisation.id)
+
+        # When
+        self.user.add_organisation(self.organisation, OrganisationRole.USER)
+
+        # Then
+        assert self.user.organisation_ids == {self.organisation.id}
+        assert self.user.belongs_to(self.organisation.id)
+
     def test_get_permitted_environments_for_org_admin_returns_all_environments(self):
         # Given
         self.user.add_organisation(self.organisation, OrganisationRole.ADMIN)
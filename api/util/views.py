@@ -1,9 +1,19 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import conditional_page
 from rest_framework.generics import GenericAPIView
 
 from environments.authentication import EnvironmentKeyAuthentication
 from environments.permissions.permissions import EnvironmentKeyPermissions
 
 
+# SDKs poll these endpoints and the responses rarely change between requests so
+# we add an ETag to GET responses and return a 304 if the client already has it.
+# The ETag is a hash of the rendered response, so this only saves bandwidth: the
+# response is still built (and integrations called) for every request. The
+# identity flags cache versions aren't used to build the ETag up front since they
+# are only maintained when that cache is enabled and, with the default local
+# memory backend, only in the process that handled the change.
+@method_decorator(conditional_page, name="dispatch")
 class SDKAPIView(GenericAPIView):
     permission_classes = (EnvironmentKeyPermissions,)
     authentication_classes = (EnvironmentKeyAuthentication,)